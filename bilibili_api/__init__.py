@@ -4,14 +4,14 @@ bilibili_api
 哔哩哔哩的各种 API 调用便捷整合（视频、动态、直播等），另外附加一些常用的功能。
 """
 
+import sys
 import asyncio
-import platform
+import importlib
 
 from .utils.sync import sync
 from .utils.credential_refresh import Credential
 from .utils.picture import Picture
 from .utils.short import get_real_url
-from .utils.parse_link import ResourceType, parse_link
 from .utils.aid_bvid_transformer import aid2bvid, bvid2aid
 from .utils.danmaku import DmMode, Danmaku, DmFontSize, SpecialDanmaku
 from .utils.network import (
@@ -39,54 +39,77 @@ from .errors import (
     CredentialNoSessdataException,
     CredentialNoDedeUserIDException,
 )
-from . import (
-    app,
-    ass,
-    hot,
-    game,
-    live,
-    note,
-    rank,
-    show,
-    user,
-    vote,
-    audio,
-    emoji,
-    login,
-    manga,
-    music,
-    topic,
-    video,
-    cheese,
-    client,
-    search,
-    article,
-    bangumi,
-    comment,
-    dynamic,
-    session,
-    festival,
-    homepage,
-    settings,
-    watchroom,
-    live_area,
-    video_tag,
-    black_room,
-    login_func,
-    video_zone,
-    favorite_list,
-    channel_series,
-    video_uploader,
-    creative_center,
-    article_category,
-    interactive_video,
-    audio_uploader,
+# 子模块按需导入 (PEP 562)，只用到部分模块时无需加载全部子模块
+_LAZY_SUBMODULES = (
+    "app",
+    "ass",
+    "hot",
+    "game",
+    "live",
+    "note",
+    "rank",
+    "show",
+    "user",
+    "vote",
+    "audio",
+    "emoji",
+    "login",
+    "manga",
+    "music",
+    "topic",
+    "video",
+    "cheese",
+    "client",
+    "search",
+    "article",
+    "bangumi",
+    "comment",
+    "dynamic",
+    "session",
+    "festival",
+    "homepage",
+    "settings",
+    "watchroom",
+    "live_area",
+    "video_tag",
+    "black_room",
+    "login_func",
+    "video_zone",
+    "favorite_list",
+    "channel_series",
+    "video_uploader",
+    "creative_center",
+    "article_category",
+    "interactive_video",
+    "audio_uploader",
 )
+# parse_link 依赖几乎所有子模块，同样按需导入
+_LAZY_ATTRIBUTES = {
+    "ResourceType": ".utils.parse_link",
+    "parse_link": ".utils.parse_link",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    if name in _LAZY_ATTRIBUTES:
+        attr = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES) | set(_LAZY_ATTRIBUTES))
+
 
 BILIBILI_API_VERSION = "16.2.0"
 
 # 如果系统为 Windows，则修改默认策略，以解决代理报错问题
-if "windows" in platform.system().lower():
+if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # type: ignore
 
 __all__ = [
@@ -2,4 +2,11 @@ from typing import List, Tuple
 
 from PyInstaller.utils.hooks import collect_data_files
 
+from bilibili_api import _LAZY_ATTRIBUTES, _LAZY_SUBMODULES
+
 datas: List[Tuple[str, str]] = collect_data_files("bilibili_api")
+
+# 子模块在 bilibili_api/__init__.py 中按需导入，需要显式声明
+hiddenimports: List[str] = [f"bilibili_api.{name}" for name in _LAZY_SUBMODULES] + [
+    f"bilibili_api{module}" for module in sorted(set(_LAZY_ATTRIBUTES.values()))
+]
@@ -7,8 +7,8 @@ bilibili_api.dynamic
 import os
 import re
 import sys
-import json
 import asyncio
+import mimetypes
 from enum import Enum
 from datetime import datetime
 from typing import Any, List, Tuple, Union, Optional
@@ -24,11 +24,24 @@ from .utils.credential import Credential
 from .utils.network import Api
 from .utils import cache_pool
 from .exceptions.DynamicExceedImagesException import DynamicExceedImagesException
-from . import opus
+from . import opus, topic
 
 API = utils.get_api("dynamic")
 raise_for_statement = utils.raise_for_statement
 
+# @人格式：“@用户名 ”，用户名中不含空白字符
+_AT_PATTERN = re.compile(r"(?<=@)\S+?(?=\s)")
+# 解析 @ 时同时进行的用户名查询数量上限
+_AT_LOOKUP_CONCURRENCY = 16
+
+
+def _load_emote_info() -> dict:
+    """
+    读取本地表情数据
+    """
+    with open(os.path.join(os.path.dirname(__file__), "data/emote.json"), "rb") as f:
+        return utils.json_loads(f.read())
+
 
 class DynamicType(Enum):
     """
@@ -86,32 +99,47 @@ async def _parse_at(text: str) -> Tuple[str, str, str]:
         tuple(str, str(int[]), str(dict)): 替换后文本，解析出艾特的 UID 列表，AT 数据
     """
     text += " "
-    pattern = re.compile(r"(?<=@).*?(?=\s)")
-    match_result = re.finditer(pattern, text)
+    # (@ 所在位置, 用户名)
+    matches = [
+        (match.start() - 1, match.group()) for match in _AT_PATTERN.finditer(text)
+    ]
+    sem = asyncio.Semaphore(_AT_LOOKUP_CONCURRENCY)
+
+    async def _name2uid(uname: str) -> Optional[int]:
+        async with sem:
+            try:
+                return (await user.name2uid(uname))["uid_list"][0]["uid"]
+            except KeyError:
+                # 没有此用户
+                return None
+
+    # 同名只查询一次，并发查询所有用户名
+    unique_unames = list(dict.fromkeys(uname for _, uname in matches))
+    uids = dict(
+        zip(
+            unique_unames,
+            await asyncio.gather(*[_name2uid(uname) for uname in unique_unames]),
+        )
+    )
     uid_list = []
-    names = []
-    for match in match_result:
-        uname = match.group()
-        try:
-            uid = (await user.name2uid(uname))["uid_list"][0]["uid"]
-        except KeyError:
-            # 没有此用户
+    ctrl = []
+    for location, uname in matches:
+        uid = uids[uname]
+        if uid is None:
             continue
-
         uid_list.append(str(uid))
-        names.append(uname + " ")
-    at_uids = ",".join(uid_list)
-    ctrl = []
-    last_index = 0
-    for i, name in enumerate(names):
-        index = text.index(f"@{name}", last_index)
-        last_index = index + 1
-        length = 2 + len(name)
+        # 长度包括开头的 @ 与结尾的空格
         ctrl.append(
-            {"location": index, "type": 1, "length": length, "data": int(uid_list[i])}
+            {
+                "location": location,
+                "type": 1,
+                "length": len(uname) + 2,
+                "data": int(uid),
+            }
         )
+    at_uids = ",".join(uid_list)
 
-    return text, at_uids, json.dumps(ctrl, ensure_ascii=False)
+    return text, at_uids, utils.json_dumps(ctrl, ensure_ascii=False).decode()
 
 
 async def _get_text_data(text: str) -> dict:
@@ -149,9 +177,7 @@ async def _get_draw_data(
         images (List[Picture]): 图片流
     """
     new_text, at_uids, ctrl = await _parse_at(text)
-    images_info = await asyncio.gather(
-        *[upload_image(stream, credential) for stream in images]
-    )
+    images_info = await upload_images(images, credential)
 
     def transformPicInfo(image: dict):
         return {
@@ -165,23 +191,38 @@ async def _get_draw_data(
         "biz": 3,
         "category": 3,
         "type": 0,
-        "pictures": json.dumps(pictures),
+        "pictures": utils.json_dumps(pictures).decode(),
         "title": "",
         "tags": "",
         "description": new_text,
         "content": new_text,
         "from": "create.dynamic.web",
         "up_choose_comment": 0,
-        "extension": json.dumps(
+        "extension": utils.json_dumps(
             {"emoji_type": 1, "from": {"emoji_type": 1}, "flag_cfg": {}}
-        ),
+        ).decode(),
         "at_uids": at_uids,
         "at_control": ctrl,
-        "setting": json.dumps({"copy_forbidden": 0, "cachedTime": 0}),
+        "setting": utils.json_dumps({"copy_forbidden": 0, "cachedTime": 0}).decode(),
     }
     return data
 
 
+def _get_image_file_field(image: Picture) -> Tuple[str, bytes, str]:
+    """
+    构造图片上传字段，直接引用图片内容而不写入临时文件
+
+    Args:
+        image (Picture): 图片流
+
+    Returns:
+        tuple(str, bytes, str): 文件名，图片内容，MIME 类型
+    """
+    filename = f"image.{image.imageType}"
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    return filename, image.content, content_type
+
+
 async def upload_image(
     image: Picture, credential: Credential, data: dict = None
 ) -> dict:
@@ -201,18 +242,47 @@ async def upload_image(
     credential.raise_for_no_bili_jct()
 
     api = API["send"]["upload_img"]
-    raw = image.content
 
     if data is None:
         data = {"biz": "new_dyn", "category": "daily"}
 
-    files = {"file_up": open(image._write_to_temp_file(), "rb")}
+    files = {"file_up": _get_image_file_field(image)}
     return_info = (
         await Api(**api, credential=credential).update_data(**data).request(files=files)
     )
     return return_info
 
 
+async def upload_images(
+    images: List[Picture],
+    credential: Credential,
+    data: dict = None,
+    concurrency: int = 4,
+) -> List[dict]:
+    """
+    并发上传多张动态图片
+
+    Args:
+        images (List[Picture]): 图片流列表. 有格式要求.
+
+        credential (Credential): 凭据
+
+        data (dict): 自定义请求体
+
+        concurrency (int, optional): 同时上传的最大数量，不宜过大以免触发风控. Defaults to 4.
+
+    Returns:
+        List[dict]: 每张图片调用 API 返回的结果，与 images 顺序一致
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _upload(image: Picture) -> dict:
+        async with sem:
+            return await upload_image(image, credential, data)
+
+    return await asyncio.gather(*[_upload(image) for image in images])
+
+
 def upload_image_sync(
     image: Picture, credential: Credential, data: dict = None
 ) -> dict:
@@ -232,12 +302,11 @@ def upload_image_sync(
     credential.raise_for_no_bili_jct()
 
     api = API["send"]["upload_img"]
-    raw = image.content
 
     if data is None:
         data = {"biz": "new_dyn", "category": "daily"}
 
-    files = {"file_up": open(image._write_to_temp_file(), "rb")}
+    files = {"file_up": _get_image_file_field(image)}
     return_info = (
         Api(**api, credential=credential).update_data(**data).request_sync(files=files)
     )
@@ -261,6 +330,22 @@ class BuildDynamic:
     ```
     """
 
+    __slots__ = (
+        "contents",
+        "pics",
+        "attach_card",
+        "topic",
+        "options",
+        "time",
+        "_pending_votes",
+    )
+
+    # 缓存枚举值，避免每次添加内容时访问 Enum.value
+    _TEXT = DynamicContentType.TEXT.value
+    _EMOJI = DynamicContentType.EMOJI.value
+    _AT = DynamicContentType.AT.value
+    _VOTE = DynamicContentType.VOTE.value
+
     def __init__(self) -> None:
         """
         构建动态内容
@@ -271,6 +356,8 @@ class BuildDynamic:
         self.topic: Optional[dict] = None
         self.options: dict = {}
         self.time: Optional[datetime] = None
+        # 尚未获取标题的投票，在 send_dynamic 中统一获取
+        self._pending_votes: List[Tuple[dict, vote.Vote]] = []
 
     @staticmethod
     def empty():
@@ -324,8 +411,19 @@ class BuildDynamic:
         Args:
             text (str): 文本内容
         """
-        self.contents.append(
-            {"biz_id": "", "type": DynamicContentType.TEXT.value, "raw_text": text}
+        self.contents.append({"biz_id": "", "type": self._TEXT, "raw_text": text})
+        return self
+
+    def add_plain_texts(self, texts: List[str]) -> "BuildDynamic":
+        """
+        批量添加纯文本
+
+        Args:
+            texts (List[str]): 文本内容列表
+        """
+        text_type = self._TEXT
+        self.contents.extend(
+            {"biz_id": "", "type": text_type, "raw_text": text} for text in texts
         )
         return self
 
@@ -337,11 +435,9 @@ class BuildDynamic:
             uid (Union[int, user.User]): 用户ID
         """
         if isinstance(uid, user.User):
-            uid = uid.__uid
+            uid = uid.get_uid()
         name = user.User(uid).get_user_info_sync().get("name")
-        self.contents.append(
-            {"biz_id": uid, "type": DynamicContentType.AT.value, "raw_text": f"@{name}"}
-        )
+        self.contents.append({"biz_id": uid, "type": self._AT, "raw_text": f"@{name}"})
         return self
 
     def add_emoji(self, emoji_id: int) -> "BuildDynamic":
@@ -351,32 +447,57 @@ class BuildDynamic:
         Args:
             emoji_id (int): 表情ID
         """
-        with open(
-            os.path.join(os.path.dirname(__file__), "data/emote.json"), encoding="UTF-8"
-        ) as f:
-            emote_info = json.load(f)
+        emote_info = _load_emote_info()
         if str(emoji_id) not in emote_info:
             raise ValueError("不存在此表情")
         self.contents.append(
             {
                 "biz_id": "",
-                "type": DynamicContentType.EMOJI.value,
+                "type": self._EMOJI,
                 "raw_text": emote_info[str(emoji_id)],
             }
         )
         return self
 
     def add_vote(self, vote: vote.Vote) -> "BuildDynamic":
-        vote.get_info_sync()
-        self.contents.append(
-            {
-                "biz_id": str(vote.get_vote_id()),
-                "type": DynamicContentType.VOTE.value,
-                "raw_text": vote.title,
-            }
-        )
+        """
+        添加投票
+
+        投票标题不在此处获取，发送动态时再统一获取
+
+        Args:
+            vote (vote.Vote): 投票类
+        """
+        content = {
+            "biz_id": str(vote.get_vote_id()),
+            "type": self._VOTE,
+            "raw_text": vote.title,
+        }
+        self.contents.append(content)
+        if vote.title is None:
+            self._pending_votes.append((content, vote))
         return self
 
+    async def _fetch_vote_titles(self) -> None:
+        """
+        并发获取所有尚未获取标题的投票的标题
+        """
+        if len(self._pending_votes) == 0:
+            return
+        # 同一投票只请求一次
+        votes = {}
+        for _, vote in self._pending_votes:
+            votes.setdefault(vote.get_vote_id(), vote)
+        titles = dict(
+            zip(
+                votes.keys(),
+                await asyncio.gather(*[vote.get_title() for vote in votes.values()]),
+            )
+        )
+        for content, vote in self._pending_votes:
+            content["raw_text"] = titles[vote.get_vote_id()]
+        self._pending_votes = []
+
     def add_image(self, image: Union[List[Picture], Picture]) -> "BuildDynamic":
         """
         添加图片
@@ -399,8 +520,7 @@ class BuildDynamic:
 
         def _get_ats(text: str) -> List:
             text += " "
-            pattern = re.compile(r"(?<=@).*?(?=\s)")
-            match_result = re.finditer(pattern, text)
+            match_result = _AT_PATTERN.finditer(text)
             uid_list = []
             names = []
             for match in match_result:
@@ -431,11 +551,7 @@ class BuildDynamic:
             return data
 
         def _get_emojis(text: str) -> List:
-            with open(
-                os.path.join(os.path.dirname(__file__), "data/emote.json"),
-                encoding="UTF-8",
-            ) as f:
-                emote_info = json.load(f)
+            emote_info = _load_emote_info()
             all_emojis = []
             for key, item in emote_info.items():
                 all_emojis.append(item)
@@ -501,7 +617,7 @@ class BuildDynamic:
                 self.contents.append(
                     {
                         "biz_id": piece["uid"],
-                        "type": DynamicContentType.AT.value,
+                        "type": self._AT,
                         "raw_text": piece["text"],
                     }
                 )
@@ -509,7 +625,7 @@ class BuildDynamic:
                 self.contents.append(
                     {
                         "biz_id": "",
-                        "type": DynamicContentType.EMOJI.value,
+                        "type": self._EMOJI,
                         "raw_text": piece["text"],
                     }
                 )
@@ -532,13 +648,15 @@ class BuildDynamic:
         }
         return self
 
-    def set_topic(self, topic_id: int) -> "BuildDynamic":
+    def set_topic(self, topic_id: Union[int, "topic.Topic"]) -> "BuildDynamic":
         """
-        设置话题
+        设置话题，支持传入 Topic 类或话题ID
 
         Args:
-            topic_id (int): 话题ID
+            topic_id (Union[int, topic.Topic]): 话题ID
         """
+        if isinstance(topic_id, topic.Topic):
+            topic_id = topic_id.get_topic_id()
         self.topic = {"id": topic_id}
         return self
 
@@ -575,6 +693,14 @@ class BuildDynamic:
         return SendDynamicType.TEXT
 
     def get_contents(self) -> list:
+        """
+        获取动态内容
+
+        通过 `add_vote` 添加的投票在 `send_dynamic` 前尚未获取标题，其 raw_text 为 None
+
+        Returns:
+            list: 动态内容
+        """
         return self.contents
 
     def get_pics(self) -> list:
@@ -604,9 +730,12 @@ async def send_dynamic(info: BuildDynamic, credential: Credential):
     """
     credential.raise_for_no_sessdata()
     credential.raise_for_no_bili_jct()
+    await info._fetch_vote_titles()
     pic_data = []
-    for image in info.pics:
-        await image.upload_file(credential)
+    for image, res in zip(info.pics, await upload_images(info.pics, credential)):
+        image.height = res["image_height"]
+        image.width = res["image_width"]
+        image.url = res["image_url"]
         pic_data.append(
             {"img_src": image.url, "img_width": image.width, "img_height": image.height}
         )
@@ -627,7 +756,7 @@ async def send_dynamic(info: BuildDynamic, credential: Credential):
         data = {
             "type": type_,
             "publish_time": int(send_time.timestamp()),  # type: ignore
-            "request": json.dumps(request_data, ensure_ascii=False),
+            "request": utils.json_dumps(request_data, ensure_ascii=False).decode(),
         }
         return await Api(**api, credential=credential).update_data(**data).result
 
@@ -729,6 +858,8 @@ class Dynamic:
         credential (Credential): 凭据类
     """
 
+    __slots__ = ("__dynamic_id", "__opus", "credential")
+
     def __init__(
         self, dynamic_id: int, credential: Union[Credential, None] = None
     ) -> None:
@@ -868,9 +999,12 @@ class Dynamic:
 
         api = API["operate"]["like"]
 
-        user_info = await user.get_self_info(credential=self.credential)
-
-        self_uid = user_info["mid"]
+        # 同一登录态的 mid 不变，缓存以省去每次点赞前的查询
+        self_uid = cache_pool.self_mid.get(self.credential.sessdata)
+        if self_uid is None:
+            user_info = await user.get_self_info(credential=self.credential)
+            self_uid = user_info["mid"]
+            cache_pool.self_mid[self.credential.sessdata] = self_uid
         data = {
             "dynamic_id": self.__dynamic_id,
             "up": 1 if status else 2,
@@ -960,6 +1094,39 @@ async def get_dynamic_page_UPs_info(credential: Credential) -> dict:
     return await Api(**api, credential=credential).result
 
 
+async def _get_dynamic_page_data(
+    credential: Credential,
+    _type: Optional[DynamicType],
+    host_mid: Optional[int],
+    features: str,
+    pn: int,
+    offset: Optional[int],
+) -> dict:
+    """
+    请求动态页动态信息，参数同 `get_dynamic_page_info`
+
+    Returns:
+        dict: 调用 API 返回的结果
+    """
+    api = API["info"]["dynamic_page_info"]
+    params = {
+        "timezone_offset": -480,
+        "features": features,
+        "page": pn,
+    }
+    params.update({"offset": offset} if offset else {})
+    if _type:  # 全部动态
+        params["type"] = _type.value
+    elif host_mid:  # 指定 UP 主动态
+        params["host_mid"] = host_mid
+    elif not _type:
+        api["params"].pop("type")
+    elif not host_mid:
+        api["params"].pop("host_mid")
+
+    return await Api(**api, credential=credential).update_params(**params).result
+
+
 async def get_dynamic_page_info(
     credential: Credential,
     _type: Optional[DynamicType] = None,
@@ -991,27 +1158,69 @@ async def get_dynamic_page_info(
     Returns:
         list[Dynamic]: 动态类列表
     """
-
-    api = API["info"]["dynamic_page_info"]
-    params = {
-        "timezone_offset": -480,
-        "features": features,
-        "page": pn,
-    }
-    params.update({"offset": offset} if offset else {})
-    if _type:  # 全部动态
-        params["type"] = _type.value
-    elif host_mid:  # 指定 UP 主动态
-        params["host_mid"] = host_mid
-    elif not _type:
-        api["params"].pop("type")
-    elif not host_mid:
-        api["params"].pop("host_mid")
-
-    dynmaic_data = (
-        await Api(**api, credential=credential).update_params(**params).result
+    dynmaic_data = await _get_dynamic_page_data(
+        credential, _type, host_mid, features, pn, offset
     )
     return [
         Dynamic(dynamic_id=int(dynamic["id_str"]), credential=credential)
         for dynamic in dynmaic_data["items"]
     ]
+
+
+async def get_dynamic_page_info_full(
+    credential: Credential,
+    _type: Optional[DynamicType] = None,
+    host_mid: Optional[int] = None,
+    features: str = "itemOpusStyle",
+    pn: int = 1,
+    offset: Optional[int] = None,
+    concurrency: int = 16,
+) -> List[dict]:
+    """
+    获取动态页动态信息，并获取其中每条动态的详细信息
+
+    参数同 `get_dynamic_page_info`，详细信息的请求以有限并发进行。
+
+    Args:
+        credential  (Credential): 凭据类.
+
+        _type       (DynamicType, optional): 动态类型. Defaults to DynamicType.ALL.
+
+        host_mid    (int, optional): 获取对应 UP 主动态的 mid. Defaults to None.
+
+        features    (str, optional): 默认 itemOpusStyle.
+
+        pn          (int, optional): 页码. Defaults to 1.
+
+        offset      (int, optional): 偏移值（下一页的第一个动态 ID，为该请求结果中的 offset 键对应的值），类似单向链表. Defaults to None.
+
+        concurrency (int, optional): 同时请求的最大数量，超过 20 容易触发风控. Defaults to 16.
+
+    Returns:
+        list[dict]: 每条动态的详细信息（同 `Dynamic.get_info`），与动态页顺序一致
+    """
+    dynmaic_data = await _get_dynamic_page_data(
+        credential, _type, host_mid, features, pn, offset
+    )
+    api = API["info"]["detail"]
+    sem = asyncio.Semaphore(concurrency)
+
+    # 不构造 Dynamic 类，避免其初始化时同步请求同一接口
+    async def _get_info(dynamic_id: int) -> dict:
+        params = {
+            "id": dynamic_id,
+            "timezone_offset": -480,
+            "features": features,
+        }
+        async with sem:
+            data = (
+                await Api(**api, credential=credential).update_params(**params).result
+            )
+        cache_pool.dynamic_is_opus[dynamic_id] = (
+            data["item"]["basic"]["comment_type"] != 11
+        )
+        return data
+
+    return await asyncio.gather(
+        *[_get_info(int(dynamic["id_str"])) for dynamic in dynmaic_data["items"]]
+    )
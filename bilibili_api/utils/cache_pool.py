@@ -3,3 +3,4 @@ article_dyn_id = {}
 dynamic_is_opus = {}
 opus_type = {}
 opus_info = {}
+self_mid = {}
@@ -20,10 +20,9 @@ from urllib.parse import quote
 
 import httpx
 import aiohttp
-
 from .sync import sync
 from .. import settings
-from .utils import get_api
+from .utils import get_api, json_dumps
 from .credential import Credential
 from ..exceptions import ApiException, ResponseCodeException, NetworkException, ExClimbWuzhiException
 from .exclimbwuzhi import *
@@ -31,6 +30,8 @@ from .exclimbwuzhi import *
 __httpx_session_pool: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
 __aiohttp_session_pool: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
 __httpx_sync_session: httpx.Client = None
+# 连接池大小，所有请求共用同一 Client 以复用 TCP/TLS 连接
+__httpx_limits = httpx.Limits(max_connections=100, max_keepalive_connections=32)
 last_proxy = ""
 wbi_mixin_key = ""
 buvid3 = ""
@@ -407,7 +408,7 @@ class Api:
 
         if self.json_body:
             config["headers"]["Content-Type"] = "application/json"
-            config["data"] = json.dumps(config["data"])
+            config["data"] = json_dumps(config["data"])
 
         return config
 
@@ -482,14 +483,21 @@ class Api:
 
         if self.json_body:
             config["headers"]["Content-Type"] = "application/json"
-            config["data"] = json.dumps(config["data"])
+            config["data"] = json_dumps(config["data"])
 
         if settings.http_client == settings.HTTPClient.AIOHTTP and not self.json_body:
             config["data"].update(config["files"])
             if config["data"] != {}:
                 data = aiohttp.FormData()
                 for key, val in config["data"].items():
-                    data.add_field(key, val)
+                    if isinstance(val, tuple):
+                        # 与 httpx 相同的 (文件名, 内容, MIME 类型) 格式
+                        filename, content, content_type = val
+                        data.add_field(
+                            key, content, filename=filename, content_type=content_type
+                        )
+                    else:
+                        data.add_field(key, val)
                 config["data"] = data
             config.pop("files")
             if settings.proxy != "":
@@ -848,10 +856,12 @@ def get_httpx_sync_session() -> httpx.Client:
         if settings.proxy != "":
             last_proxy = settings.proxy
             proxies = {"all://": settings.proxy}
-            session = httpx.Client(proxies=proxies)  # type: ignore
+            session = httpx.Client(  # type: ignore
+                proxies=proxies, limits=__httpx_limits
+            )
         else:
             last_proxy = ""
-            session = httpx.Client()
+            session = httpx.Client(limits=__httpx_limits)
         __httpx_sync_session = session
 
     return __httpx_sync_session
@@ -882,10 +892,12 @@ def get_session() -> httpx.AsyncClient:
         if settings.proxy != "":
             last_proxy = settings.proxy
             proxies = {"all://": settings.proxy}
-            session = httpx.AsyncClient(proxies=proxies)  # type: ignore
+            session = httpx.AsyncClient(  # type: ignore
+                proxies=proxies, limits=__httpx_limits
+            )
         else:
             last_proxy = ""
-            session = httpx.AsyncClient()
+            session = httpx.AsyncClient(limits=__httpx_limits)
         __httpx_session_pool[loop] = session
 
     return session
@@ -7,9 +7,48 @@ bilibili_api.utils.utils
 import json
 import os
 import random
-from typing import List, TypeVar
+from typing import Any, List, TypeVar, Union
 from ..exceptions import StatementException
 
+try:
+    import orjson
+except ImportError:
+    # PyPy 等无法安装 orjson 的环境回退到标准库
+    orjson = None
+
+
+def json_dumps(obj: Any, ensure_ascii: bool = True) -> bytes:
+    """
+    序列化为 json，优先使用 orjson。
+
+    orjson 不转义非 ASCII 字符，回退到标准库时按 ensure_ascii 处理。
+
+    Args:
+        obj          (Any) : 要序列化的对象
+        ensure_ascii (bool): 标准库是否转义非 ASCII 字符. Defaults to True.
+
+    Returns:
+        bytes, UTF-8 编码的 json。
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=ensure_ascii).encode("utf-8")
+
+
+def json_loads(raw: Union[str, bytes]) -> Any:
+    """
+    解析 json，优先使用 orjson。
+
+    Args:
+        raw (str | bytes): json 文本
+
+    Returns:
+        Any, 解析结果。
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def get_api(field: str, *args) -> dict:
     """
@@ -27,11 +66,12 @@ def get_api(field: str, *args) -> dict:
         )
     )
     if os.path.exists(path):
-        with open(path, encoding="utf8") as f:
-            data = json.load(f)
-            for arg in args:
-                data = data[arg]
-            return data
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = json_loads(raw)
+        for arg in args:
+            data = data[arg]
+        return data
     else:
         return {}
 
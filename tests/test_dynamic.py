@@ -91,5 +91,11 @@ async def test_n_get_dynamic_page_info_by_mid():
     )
 
 
+async def test_o_get_dynamic_page_info_full():
+    return await dynamic.get_dynamic_page_info_full(
+        credential=common.get_credential(), host_mid=12434430
+    )
+
+
 async def test_p_get_reaction():
     return await dy.get_reaction()